@@ -11,7 +11,15 @@ Tools provided:
 - ea_summary: Generate a summary of work over time
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
+import mmap
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional, Literal
@@ -36,7 +44,7 @@ SERVER_METADATA = {
         {"name": "ea_journal_status", "description": "Get server status and metadata"},
     ],
     "entry_types": ["work", "decision", "blocker", "note", "win", "learning"],
-    "storage_location": "~/.ea-journal/<date>.json",
+    "storage_location": "~/.ea-journal/<date>.ndjson",
 }
 
 # Initialize the MCP server
@@ -146,6 +154,24 @@ class SummaryInput(BaseModel):
 
 # === Storage ===
 
+# orjson (C extension) encodes/decodes several times faster than the
+# stdlib. It is optional: without it the shim falls back to json.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _loads(data):
+        return json.loads(data)
+
+
 def get_storage_path() -> Path:
     """Get the path to the journal storage directory."""
     storage_dir = Path.home() / ".ea-journal"
@@ -153,27 +179,168 @@ def get_storage_path() -> Path:
     return storage_dir
 
 
-def get_journal_file(date: datetime) -> Path:
-    """Get the journal file for a specific date."""
+def get_journal_file(date) -> Path:
+    """Get the journal file for a date (datetime or YYYY-MM-DD string)."""
     storage_dir = get_storage_path()
-    return storage_dir / f"{date.strftime('%Y-%m-%d')}.json"
+    date_str = date if isinstance(date, str) else date.strftime('%Y-%m-%d')
+    return storage_dir / f"{date_str}.ndjson"
+
+
+def list_present_dates() -> set:
+    """Collect the dates that have a journal file, in one directory scan.
+
+    Multi-day tools check membership here instead of issuing one stat
+    per day in the range.
+    """
+    present = set()
+    try:
+        with os.scandir(get_storage_path()) as it:
+            for dirent in it:
+                name = dirent.name
+                if name.endswith(".ndjson"):
+                    present.add(name[:-7])
+                elif name.endswith(".json"):
+                    present.add(name[:-5])
+    except OSError:
+        pass
+    return present
 
 
 def load_journal(date: datetime) -> list:
-    """Load journal entries for a specific date."""
+    """Load journal entries for a specific date.
+
+    Entries are stored one JSON object per line (NDJSON). Blank or
+    corrupt lines are skipped so a torn write never loses the whole day.
+    Entries from the old single-JSON-array format come first, so a day
+    that straddles the format change still shows everything.
+    """
+    entries = _load_legacy_journal(date)
+    journal_file = get_journal_file(date)
+    if not journal_file.exists():
+        return entries
+
+    try:
+        with journal_file.open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(_loads(line))
+                except ValueError:
+                    continue
+    except IOError:
+        pass
+    return entries
+
+
+def iter_journal_entries(date: datetime):
+    """Yield entries for a date by memory-mapping the NDJSON file.
+
+    Scan-and-discard callers (ea_review, ea_summary) use this instead of
+    load_journal: mapping the file avoids allocating a full bytes copy
+    per day and lets the kernel manage the page cache. Corrupt lines are
+    skipped, and legacy entries are merged in first, same as
+    load_journal.
+    """
+    yield from _load_legacy_journal(date)
     journal_file = get_journal_file(date)
-    if journal_file.exists():
+    if not journal_file.exists():
+        return
+    try:
+        with journal_file.open("rb") as f:
+            # mmap refuses empty files; ValueError also covers that case
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield _loads(line)
+                    except ValueError:
+                        continue
+    except (IOError, ValueError):
+        return
+
+
+def _load_legacy_journal(date: datetime) -> list:
+    """Load entries from the old single-JSON-array format, if present."""
+    legacy_file = get_journal_file(date).with_suffix(".json")
+    if legacy_file.exists():
         try:
-            return json.loads(journal_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, IOError):
+            return _loads(legacy_file.read_bytes())
+        except (ValueError, IOError):
             return []
     return []
 
 
-def save_journal(date: datetime, entries: list) -> None:
-    """Save journal entries for a specific date."""
-    journal_file = get_journal_file(date)
-    journal_file.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+# === Write Buffer ===
+
+# ea_log enqueues encoded lines instead of opening the file per call; a
+# background task drains the queue so a burst of logs costs one append
+# per file instead of one open/write/close each. Readers flush first so
+# they always see buffered entries.
+
+FLUSH_INTERVAL = 0.1  # seconds a burst may accumulate before hitting disk
+FLUSH_BATCH = 64      # flush immediately once this many lines are queued
+
+# A deque, not an asyncio.Queue: readers drain the buffer from worker
+# threads (via asyncio.to_thread) as well as from the event loop, and
+# deque.append/popleft are atomic under the GIL where asyncio.Queue is
+# documented as not thread-safe.
+_WRITE_QUEUE: deque = deque()
+_FLUSHER_TASK: Optional[asyncio.Task] = None
+
+
+def flush_writes() -> None:
+    """Drain the write queue, coalescing one append per journal file."""
+    pending: dict = {}
+    while True:
+        try:
+            path, line = _WRITE_QUEUE.popleft()
+        except IndexError:
+            break
+        pending.setdefault(path, []).append(line)
+    for path, lines in pending.items():
+        with path.open("ab") as f:
+            f.write(b"".join(lines))
+
+
+async def _flusher_loop() -> None:
+    """Background task that flushes buffered writes periodically."""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL)
+        if _WRITE_QUEUE:
+            await asyncio.to_thread(flush_writes)
+
+
+async def append_entry(date, entry: dict) -> None:
+    """Queue a single entry for appending to the day's journal file."""
+    global _FLUSHER_TASK
+    if _FLUSHER_TASK is None or _FLUSHER_TASK.done():
+        _FLUSHER_TASK = asyncio.get_running_loop().create_task(_flusher_loop())
+    _WRITE_QUEUE.append((get_journal_file(date), _dumps(entry) + b"\n"))
+    if len(_WRITE_QUEUE) >= FLUSH_BATCH:
+        await asyncio.to_thread(flush_writes)
+
+
+# Don't drop buffered entries on shutdown
+atexit.register(flush_writes)
+
+
+# Cache for the second-resolution part of timestamps, so logging twice
+# in the same second skips strftime (and a datetime allocation) entirely.
+_TS_CACHE: dict = {"sec": -1, "prefix": ""}
+
+
+def utc_now_iso() -> str:
+    """Build an ISO 8601 UTC timestamp without datetime on the hot path."""
+    ns = time.time_ns()
+    sec, frac = divmod(ns, 1_000_000_000)
+    if sec != _TS_CACHE["sec"]:
+        _TS_CACHE["prefix"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE["sec"] = sec
+    return f"{_TS_CACHE['prefix']}.{frac // 1000:06d}+00:00"
 
 
 def parse_date(date_str: str) -> datetime:
@@ -181,17 +348,30 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
 
 
-def format_entry(entry: dict, show_date: bool = False) -> str:
+# Two specialized formatters instead of one function re-evaluating the
+# show_date ternary per entry; render loops pick one up front. The
+# timestamp is fixed-width ISO 8601, so slicing replaces split().
+def _format_entry(entry: dict) -> str:
     """Format a single entry for display."""
-    time_str = entry["timestamp"].split("T")[1][:5]
-    date_prefix = f"{entry['timestamp'][:10]} " if show_date else ""
     project_str = f" [{entry['project']}]" if entry.get("project") else ""
+    return f"""**[{entry['timestamp'][11:16]}] {entry['type'].upper()}{project_str}**
+{entry['content']}
+"""
 
-    return f"""**[{date_prefix}{time_str}] {entry['type'].upper()}{project_str}**
+
+def _format_entry_dated(entry: dict) -> str:
+    """Format a single entry for display, prefixed with its date."""
+    project_str = f" [{entry['project']}]" if entry.get("project") else ""
+    return f"""**[{entry['timestamp'][:10]} {entry['timestamp'][11:16]}] {entry['type'].upper()}{project_str}**
 {entry['content']}
 """
 
 
+def format_entry(entry: dict, show_date: bool = False) -> str:
+    """Format a single entry, dispatching to a specialized formatter."""
+    return _format_entry_dated(entry) if show_date else _format_entry(entry)
+
+
 # === Tools ===
 
 @mcp.tool(
@@ -226,24 +406,24 @@ async def ea_log(params: LogInput) -> str:
         - Log blocker: "API rate limiting causing test failures"
         - Log win: "Got the demo working!"
     """
-    now = datetime.now(timezone.utc)
+    # The date and display time are sliced out of the timestamp string
+    # instead of paying for extra strftime calls.
+    ts = utc_now_iso()
 
     entry = {
-        "id": f"entry_{now.strftime('%H%M%S')}_{hash(params.content) % 10000:04d}",
+        "id": f"entry_{ts[11:13]}{ts[14:16]}{ts[17:19]}_{hashlib.blake2b(params.content.encode('utf-8'), digest_size=3).hexdigest()}",
         "content": params.content,
         "type": params.entry_type.value,
         "project": params.project,
-        "timestamp": now.isoformat()
+        "timestamp": ts
     }
 
-    entries = load_journal(now)
-    entries.append(entry)
-    save_journal(now, entries)
+    await append_entry(ts[:10], entry)
 
     project_line = f"Project: {params.project}\n" if params.project else ""
     preview = params.content[:100] + ('...' if len(params.content) > 100 else '')
 
-    return f"""Logged {params.entry_type.value.upper()} at {now.strftime('%H:%M')}
+    return f"""Logged {params.entry_type.value.upper()} at {ts[11:16]}
 {project_line}Entry: {preview}"""
 
 
@@ -275,7 +455,8 @@ async def ea_today(params: TodayInput) -> str:
         - "Show today's blockers" -> only blocker entries
     """
     now = datetime.now(timezone.utc)
-    entries = load_journal(now)
+    await asyncio.to_thread(flush_writes)
+    entries = await asyncio.to_thread(load_journal, now)
 
     if not entries:
         return f"No journal entries for today ({now.strftime('%Y-%m-%d')}). Use ea_log to add your first entry!"
@@ -307,7 +488,7 @@ async def ea_today(params: TodayInput) -> str:
         if entry_t in by_type:
             output.append(f"## {entry_t.title()}s\n")
             for entry in by_type[entry_t]:
-                output.append(format_entry(entry))
+                output.append(_format_entry(entry))
 
     return "\n".join(output)
 
@@ -343,23 +524,30 @@ async def ea_review(params: ReviewInput) -> str:
         - "Review decisions from last 30 days" -> only decisions
     """
     now = datetime.now(timezone.utc)
+    await asyncio.to_thread(flush_writes)
 
-    # Determine date range
+    # Determine date range (one directory scan prunes absent days)
     if params.days:
-        dates = [(now - timedelta(days=i)) for i in range(params.days)]
+        present = await asyncio.to_thread(list_present_dates)
+        dates = [d for d in ((now - timedelta(days=i)) for i in range(params.days))
+                 if d.strftime("%Y-%m-%d") in present]
     elif params.date:
         target = parse_date(params.date)
         dates = [target]
     else:
         dates = [now]
 
-    # Collect entries
-    all_entries = []
-    for d in dates:
-        entries = load_journal(d)
-        for entry in entries:
-            entry["_date"] = d.strftime("%Y-%m-%d")
-            all_entries.append(entry)
+    # Collect entries as (date, entry) pairs; the loaded dicts are never
+    # mutated so they stay safe to cache and share between calls. The
+    # file scanning runs in a worker thread to keep the event loop free.
+    def _collect() -> list:
+        collected: list = []
+        for d in dates:
+            date_str = d.strftime("%Y-%m-%d")
+            collected.extend((date_str, e) for e in iter_journal_entries(d))
+        return collected
+
+    all_entries = await asyncio.to_thread(_collect)
 
     if not all_entries:
         if params.days:
@@ -369,12 +557,12 @@ async def ea_review(params: ReviewInput) -> str:
 
     # Filter by type
     if params.entry_type:
-        all_entries = [e for e in all_entries if e["type"] == params.entry_type.value]
+        all_entries = [pair for pair in all_entries if pair[1]["type"] == params.entry_type.value]
         if not all_entries:
             return f"No {params.entry_type.value} entries found."
 
     # Sort by timestamp (newest first)
-    all_entries.sort(key=lambda e: e["timestamp"], reverse=True)
+    all_entries.sort(key=lambda pair: pair[1]["timestamp"], reverse=True)
 
     # Format output
     if params.days:
@@ -385,13 +573,15 @@ async def ea_review(params: ReviewInput) -> str:
     output.append(f"**Total entries:** {len(all_entries)}\n")
     output.append("---\n")
 
+    # Entries are grouped under date headings, so the undated formatter
+    # is chosen once here rather than branching per entry
+    fmt = _format_entry
     current_date = None
-    for entry in all_entries:
-        entry_date = entry["_date"]
+    for entry_date, entry in all_entries:
         if entry_date != current_date:
             current_date = entry_date
             output.append(f"\n## {entry_date}\n")
-        output.append(format_entry(entry))
+        output.append(fmt(entry))
 
     return "\n".join(output)
 
@@ -424,29 +614,42 @@ async def ea_summary(params: SummaryInput) -> str:
         - "Summarize this month" -> 30-day summary
     """
     now = datetime.now(timezone.utc)
+    await asyncio.to_thread(flush_writes)
 
-    # Collect all entries
-    all_entries = []
-    dates_with_entries = 0
-    for i in range(params.days):
-        d = now - timedelta(days=i)
-        entries = load_journal(d)
-        if entries:
-            dates_with_entries += 1
-            all_entries.extend(entries)
+    # Load the day files in parallel (I/O-bound), then gather counts and
+    # highlights in a single pass over the entries. One directory scan
+    # prunes absent days up front instead of a stat per day. The pool
+    # runs via to_thread so waiting on it doesn't stall the event loop.
+    present = await asyncio.to_thread(list_present_dates)
+    dates = [d for d in ((now - timedelta(days=i)) for i in range(params.days))
+             if d.strftime("%Y-%m-%d") in present]
 
-    if not all_entries:
-        return f"No journal entries in the last {params.days} days. Start journaling with ea_log!"
+    def _load_days() -> list:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return list(pool.map(lambda d: list(iter_journal_entries(d)), dates))
 
-    # Calculate statistics
-    by_type: dict = {}
-    by_project: dict = {}
-    for entry in all_entries:
-        t = entry["type"]
-        by_type[t] = by_type.get(t, 0) + 1
+    per_day = await asyncio.to_thread(_load_days)
+
+    total_entries = 0
+    dates_with_entries = 0
+    by_type: Counter = Counter()
+    by_project: Counter = Counter()
+    highlights: dict = {"win": [], "blocker": [], "learning": []}
 
-        project = entry.get("project") or "General"
-        by_project[project] = by_project.get(project, 0) + 1
+    for entries in per_day:
+        if not entries:
+            continue
+        dates_with_entries += 1
+        for entry in entries:
+            total_entries += 1
+            t = entry["type"]
+            by_type[t] += 1
+            by_project[entry.get("project") or "General"] += 1
+            if t in highlights and len(highlights[t]) < 5:
+                highlights[t].append(entry)
+
+    if not total_entries:
+        return f"No journal entries in the last {params.days} days. Start journaling with ea_log!"
 
     # Build summary
     start_date = (now - timedelta(days=params.days - 1)).strftime('%Y-%m-%d')
@@ -455,7 +658,7 @@ async def ea_summary(params: SummaryInput) -> str:
     output = [f"# Work Summary - Last {params.days} Days\n"]
     output.append(f"**Period:** {start_date} to {end_date}")
     output.append(f"**Active days:** {dates_with_entries} of {params.days}")
-    output.append(f"**Total entries:** {len(all_entries)}")
+    output.append(f"**Total entries:** {total_entries}")
     output.append("")
 
     # Type breakdown
@@ -470,28 +673,13 @@ async def ea_summary(params: SummaryInput) -> str:
         for project, count in sorted(by_project.items(), key=lambda x: -x[1]):
             output.append(f"- **{project}:** {count} entries")
 
-    # Highlights
-    wins = [e for e in all_entries if e["type"] == "win"]
-    blockers = [e for e in all_entries if e["type"] == "blocker"]
-    learnings = [e for e in all_entries if e["type"] == "learning"]
-
-    if wins:
-        output.append("\n## Wins\n")
-        for entry in wins[:5]:
-            preview = entry['content'][:100]
-            output.append(f"- {preview}")
-
-    if blockers:
-        output.append("\n## Blockers\n")
-        for entry in blockers[:5]:
-            preview = entry['content'][:100]
-            output.append(f"- {preview}")
-
-    if learnings:
-        output.append("\n## Learnings\n")
-        for entry in learnings[:5]:
-            preview = entry['content'][:100]
-            output.append(f"- {preview}")
+    # Highlights (capped at 5 per type during the scan above)
+    for entry_t, heading in [("win", "Wins"), ("blocker", "Blockers"), ("learning", "Learnings")]:
+        if highlights[entry_t]:
+            output.append(f"\n## {heading}\n")
+            for entry in highlights[entry_t]:
+                preview = entry['content'][:100]
+                output.append(f"- {preview}")
 
     return "\n".join(output)
 
@@ -518,12 +706,14 @@ async def ea_journal_status() -> str:
         str: Server metadata and status formatted as markdown
     """
     now = datetime.now(timezone.utc)
-    today_entries = load_journal(now)
+    await asyncio.to_thread(flush_writes)
+    today_entries = await asyncio.to_thread(load_journal, now)
     storage_dir = get_storage_path()
 
-    # Count journal files (days with entries)
-    journal_files = list(storage_dir.glob("*.json"))
-    total_days = len(journal_files)
+    # Count journal files (days with entries, including legacy .json days)
+    journal_days = {f.stem for f in storage_dir.glob("*.ndjson")}
+    journal_days.update(f.stem for f in storage_dir.glob("*.json"))
+    total_days = len(journal_days)
 
     # Count today's entries by type
     type_counts = {}
@@ -11,8 +11,12 @@ Tools provided:
 - ea_forget: Delete a memory by ID
 """
 
+import asyncio
+import heapq
 import json
-from datetime import datetime, timezone
+import time
+from array import array
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, List
 from pydantic import BaseModel, Field, ConfigDict
@@ -34,7 +38,7 @@ SERVER_METADATA = {
         {"name": "ea_forget", "description": "Delete a memory by ID"},
         {"name": "ea_memory_status", "description": "Get server status and metadata"},
     ],
-    "storage_location": "~/.ea-memory/memories.json",
+    "storage_location": "~/.ea-memory/memories.ndjson (+ archive.json overflow)",
 }
 
 # Initialize the MCP server
@@ -126,28 +130,250 @@ class ForgetInput(BaseModel):
 
 # === Storage ===
 
+# orjson (C extension) encodes/decodes several times faster than the
+# stdlib. It is optional: without it the shim falls back to json.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _loads(data):
+        return json.loads(data)
+
+
+# Memories are split into two generations: memories.json holds the hot
+# set every tool scans, archive.json holds older overflow that is only
+# read when a query can't be satisfied from the hot set.
+RECENT_MAX = 1024
+
+
 def get_storage_path() -> Path:
-    """Get the path to the memory storage file."""
+    """Get the path to the hot (recent) memory storage file."""
+    storage_dir = Path.home() / ".ea-memory"
+    storage_dir.mkdir(exist_ok=True)
+    return storage_dir / "memories.ndjson"
+
+
+def get_meta_path() -> Path:
+    """Get the path to the sidecar file holding next_id."""
     storage_dir = Path.home() / ".ea-memory"
     storage_dir.mkdir(exist_ok=True)
-    return storage_dir / "memories.json"
+    return storage_dir / "meta.json"
+
+
+def get_archive_path() -> Path:
+    """Get the path to the cold (archived) memory storage file."""
+    storage_dir = Path.home() / ".ea-memory"
+    storage_dir.mkdir(exist_ok=True)
+    return storage_dir / "archive.json"
+
+
+# In-process cache so read-heavy tools don't re-parse the whole file on
+# every call. Invalidated by comparing the file's mtime. The "index"
+# slot holds search indexes derived from "data" (built lazily).
+_MEM_CACHE: dict = {"mtime": None, "data": None, "index": None}
 
 
 def load_memories() -> dict:
-    """Load memories from storage."""
+    """Load hot memories from storage (cached until the file changes).
+
+    The hot store is NDJSON: one memory per line, with next_id kept in
+    the meta.json sidecar. Blank or corrupt lines (e.g. a torn tail
+    write) are skipped per line instead of discarding the whole store.
+    """
     storage_path = get_storage_path()
-    if storage_path.exists():
+    try:
+        st = storage_path.stat()
+    except FileNotFoundError:
+        return _load_legacy_memories()
+
+    if _MEM_CACHE["mtime"] == st.st_mtime_ns and _MEM_CACHE["data"] is not None:
+        return _MEM_CACHE["data"]
+
+    memories = []
+    try:
+        with storage_path.open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    memories.append(_loads(line))
+                except ValueError:
+                    continue
+    except IOError:
+        return {"memories": [], "next_id": 1}
+
+    data = {"memories": memories, "next_id": _next_id_for(memories)}
+
+    _MEM_CACHE["mtime"] = st.st_mtime_ns
+    _MEM_CACHE["data"] = data
+    _MEM_CACHE["index"] = None
+    return data
+
+
+def _load_legacy_memories() -> dict:
+    """Load from the old single-JSON memories.json file, if present."""
+    legacy_path = get_storage_path().with_suffix(".json")
+    if legacy_path.exists():
         try:
-            return json.loads(storage_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, IOError):
-            return {"memories": [], "next_id": 1}
+            return _loads(legacy_path.read_bytes())
+        except (ValueError, IOError):
+            pass
     return {"memories": [], "next_id": 1}
 
 
+def _next_id_for(memories: list) -> int:
+    """Get next_id from the sidecar, or recover it from the IDs on disk."""
+    try:
+        next_id = _loads(get_meta_path().read_bytes())["next_id"]
+        if isinstance(next_id, int):
+            return next_id
+    except (ValueError, IOError, KeyError):
+        pass
+    next_id = 1
+    for mem in memories:
+        try:
+            next_id = max(next_id, int(mem["id"].rsplit("_", 1)[1]) + 1)
+        except (KeyError, IndexError, ValueError):
+            continue
+    return next_id
+
+
+def _save_meta(data: dict) -> None:
+    get_meta_path().write_bytes(_dumps({"next_id": data["next_id"], "count": len(data["memories"])}))
+
+
 def save_memories(data: dict) -> None:
-    """Save memories to storage."""
+    """Rewrite the hot store in full and refresh the cache."""
+    storage_path = get_storage_path()
+    with storage_path.open("wb") as f:
+        for mem in data["memories"]:
+            f.write(_dumps(mem) + b"\n")
+    _save_meta(data)
+    _MEM_CACHE["mtime"] = storage_path.stat().st_mtime_ns
+    _MEM_CACHE["data"] = data
+    _MEM_CACHE["index"] = None
+
+
+def append_memory(data: dict, memory: dict) -> None:
+    """Append a single memory line to the hot store (common write path)."""
     storage_path = get_storage_path()
-    storage_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    with storage_path.open("ab") as f:
+        f.write(_dumps(memory) + b"\n")
+    _save_meta(data)
+    _MEM_CACHE["mtime"] = storage_path.stat().st_mtime_ns
+    _MEM_CACHE["data"] = data
+    _MEM_CACHE["index"] = None
+
+
+# Separate mtime cache for the archive; it only changes on compaction
+# or an archived delete, so this almost never misses.
+_ARCHIVE_CACHE: dict = {"mtime": None, "data": None}
+
+
+def load_archive() -> list:
+    """Load archived memories (cached until the file changes on disk)."""
+    archive_path = get_archive_path()
+    try:
+        st = archive_path.stat()
+    except FileNotFoundError:
+        return []
+
+    if _ARCHIVE_CACHE["mtime"] == st.st_mtime_ns and _ARCHIVE_CACHE["data"] is not None:
+        return _ARCHIVE_CACHE["data"]
+
+    try:
+        memories = _loads(archive_path.read_bytes())
+    except (ValueError, IOError):
+        return []
+
+    _ARCHIVE_CACHE["mtime"] = st.st_mtime_ns
+    _ARCHIVE_CACHE["data"] = memories
+    return memories
+
+
+def save_archive(memories: list) -> None:
+    """Save archived memories and refresh the cache.
+
+    Written compact: pretty-printing roughly doubles the bytes on disk
+    and the encode time. For human inspection, pipe the file through
+    `python -m json.tool` instead.
+    """
+    archive_path = get_archive_path()
+    archive_path.write_bytes(_dumps(memories))
+    _ARCHIVE_CACHE["mtime"] = archive_path.stat().st_mtime_ns
+    _ARCHIVE_CACHE["data"] = memories
+
+
+def maybe_archive(data: dict) -> None:
+    """Move the oldest memories to the archive once the hot set is full.
+
+    Keeps the newest RECENT_MAX memories in the hot file so everyday
+    scans touch a bounded working set.
+    """
+    memories = data["memories"]
+    if len(memories) <= RECENT_MAX:
+        return
+    memories.sort(key=itemgetter("created_at"))
+    cutoff = len(memories) - RECENT_MAX
+    archive = load_archive() + memories[:cutoff]
+    archive.sort(key=itemgetter("created_at"))
+    save_archive(archive)
+    data["memories"] = memories[cutoff:]
+
+
+def _build_search_index(memories: list) -> dict:
+    """Build search indexes over the memory list.
+
+    - "lower": lowercased UTF-8 content per memory; byte-level find is
+      C-level and skips a per-query .lower() over every memory
+    - "trigram": 3-byte substring -> set of memory indexes
+    - "tags": tag -> set of memory indexes
+    - "tags_frozen": frozenset of tags per memory (for isdisjoint checks)
+    - "by_id": memory ID -> memory dict (primary index)
+    - "importance"/"created": parallel columns (struct-of-arrays) so the
+      scan loops read compact values instead of chasing dict pointers
+    """
+    lower = [m["content"].lower().encode("utf-8") for m in memories]
+    trigram: dict = {}
+    tags: dict = {}
+    tags_frozen = [frozenset(m.get("tags", [])) for m in memories]
+    by_id = {m["id"]: m for m in memories}
+    importance = array("B", (m.get("importance", 50) for m in memories))
+    created = [m["created_at"] for m in memories]
+    for i, content in enumerate(lower):
+        for j in range(len(content) - 2):
+            trigram.setdefault(content[j:j + 3], set()).add(i)
+    for i, mem_tags in enumerate(tags_frozen):
+        for tag in mem_tags:
+            tags.setdefault(tag, set()).add(i)
+    return {
+        "lower": lower,
+        "trigram": trigram,
+        "tags": tags,
+        "tags_frozen": tags_frozen,
+        "by_id": by_id,
+        "importance": importance,
+        "created": created,
+    }
+
+
+def get_search_index(data: dict) -> dict:
+    """Get (building if needed) the search indexes for loaded memories."""
+    if data is _MEM_CACHE["data"] and _MEM_CACHE["index"] is not None:
+        return _MEM_CACHE["index"]
+    index = _build_search_index(data["memories"])
+    if data is _MEM_CACHE["data"]:
+        _MEM_CACHE["index"] = index
+    return index
 
 
 def generate_id(data: dict) -> str:
@@ -157,6 +383,21 @@ def generate_id(data: dict) -> str:
     return mem_id
 
 
+# Cache for the second-resolution part of timestamps, so storing twice
+# in the same second skips strftime (and a datetime allocation) entirely.
+_TS_CACHE: dict = {"sec": -1, "prefix": ""}
+
+
+def utc_now_iso() -> str:
+    """Build an ISO 8601 UTC timestamp without datetime on the hot path."""
+    ns = time.time_ns()
+    sec, frac = divmod(ns, 1_000_000_000)
+    if sec != _TS_CACHE["sec"]:
+        _TS_CACHE["prefix"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE["sec"] = sec
+    return f"{_TS_CACHE['prefix']}.{frac // 1000:06d}+00:00"
+
+
 def parse_tags(tags_str: Optional[str]) -> List[str]:
     """Parse comma-separated tags into a list."""
     if not tags_str:
@@ -195,7 +436,7 @@ async def ea_remember(params: RememberInput) -> str:
         - "Remember the API endpoint is /api/v1/users" -> stores with default importance
         - "Remember this bugfix with tags 'python,bugfix'" -> stores with tags
     """
-    data = load_memories()
+    data = await asyncio.to_thread(load_memories)
 
     tag_list = parse_tags(params.tags)
     importance = params.importance or 50
@@ -205,11 +446,16 @@ async def ea_remember(params: RememberInput) -> str:
         "content": params.content,
         "tags": tag_list,
         "importance": importance,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utc_now_iso(),
     }
 
     data["memories"].append(memory)
-    save_memories(data)
+    if len(data["memories"]) > RECENT_MAX or not get_storage_path().exists():
+        # Archive overflow (or first write / legacy migration): rewrite in full
+        await asyncio.to_thread(maybe_archive, data)
+        await asyncio.to_thread(save_memories, data)
+    else:
+        await asyncio.to_thread(append_memory, data, memory)
 
     tag_display = ", ".join(tag_list) if tag_list else "none"
     return f"""Remembered: {memory['id']}
@@ -247,7 +493,7 @@ async def ea_recall(params: RecallInput) -> str:
         - "Recall API" -> finds memories containing "API"
         - "Recall database with tags 'config'" -> finds database memories tagged 'config'
     """
-    data = load_memories()
+    data = await asyncio.to_thread(load_memories)
     memories = data["memories"]
 
     if not memories:
@@ -255,22 +501,72 @@ async def ea_recall(params: RecallInput) -> str:
 
     filter_tags = parse_tags(params.tags)
     query_lower = params.query.lower()
-    results = []
-
-    for mem in memories:
-        if query_lower not in mem["content"].lower():
+    query_bytes = query_lower.encode("utf-8")
+    index = get_search_index(data)
+
+    # Prune to a candidate set by intersecting trigram posting lists,
+    # then confirm with a real substring check. Short queries fall back
+    # to scanning everything.
+    if len(query_bytes) >= 3:
+        candidates: Optional[set] = None
+        for j in range(len(query_bytes) - 2):
+            posting = index["trigram"].get(query_bytes[j:j + 3])
+            if not posting:
+                candidates = set()
+                break
+            candidates = set(posting) if candidates is None else candidates & posting
+    else:
+        candidates = set(range(len(memories)))
+
+    if filter_tags:
+        tagged: set = set()
+        for t in filter_tags:
+            tagged |= index["tags"].get(t, set())
+        candidates = candidates & tagged
+
+    # Confirm candidates and keep only the top `limit` in a bounded
+    # min-heap keyed by (importance, created_at): one fused pass, O(limit)
+    # memory, no full sort. The unique sequence number breaks key ties so
+    # the dicts themselves are never compared.
+    lower = index["lower"]
+    importance_col = index["importance"]
+    created_col = index["created"]
+    heap: list = []
+    seq = 0
+    total_matches = 0
+    for i in sorted(candidates):
+        if lower[i].find(query_bytes) < 0:
             continue
-        if filter_tags:
-            mem_tags = set(mem.get("tags", []))
-            if not any(t in mem_tags for t in filter_tags):
+        total_matches += 1
+        # Rank from the SoA columns; the memory dict itself is only
+        # touched if the entry actually makes the heap
+        key = (importance_col[i], created_col[i])
+        if len(heap) < params.limit:
+            heapq.heappush(heap, (key, seq, memories[i]))
+            seq += 1
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, seq, memories[i]))
+            seq += 1
+
+    # Hot set first; only scan the archive if we still need results
+    if total_matches < params.limit:
+        filter_tag_set = set(filter_tags)
+        for mem in await asyncio.to_thread(load_archive):
+            if query_lower not in mem["content"].lower():
                 continue
-        results.append(mem)
-
-    # Sort by importance (desc), then date (desc)
-    results.sort(key=lambda m: (-m["importance"], m["created_at"]), reverse=False)
-
-    total_matches = len(results)
-    results = results[:params.limit]
+            if filter_tag_set and filter_tag_set.isdisjoint(mem.get("tags", [])):
+                continue
+            total_matches += 1
+            key = (mem["importance"], mem["created_at"])
+            if len(heap) < params.limit:
+                heapq.heappush(heap, (key, seq, mem))
+                seq += 1
+            elif key > heap[0][0]:
+                heapq.heapreplace(heap, (key, seq, mem))
+                seq += 1
+
+    # Importance (desc), then date (desc)
+    results = [item[2] for item in sorted(heap, key=itemgetter(0), reverse=True)]
 
     if not results:
         return f"No memories found matching: {params.query}"
@@ -324,30 +620,44 @@ async def ea_list(params: ListInput) -> str:
         - "List memories with tags 'api'" -> shows only API-tagged memories
         - "List memories with offset 20" -> shows memories 21-40
     """
-    data = load_memories()
+    data = await asyncio.to_thread(load_memories)
     memories = data["memories"]
 
     if not memories:
         return "No memories stored yet. Use ea_remember to store your first memory."
 
-    filter_tags = parse_tags(params.tags)
-
-    # Filter by tags
-    results = []
-    for mem in memories:
+    filter_tags = frozenset(parse_tags(params.tags))
+
+    # Filter by tags: one C-level isdisjoint call per memory against the
+    # frozensets prebuilt at load time, instead of a fresh set + any()
+    if filter_tags:
+        tags_frozen = get_search_index(data)["tags_frozen"]
+        results = [m for i, m in enumerate(memories) if not filter_tags.isdisjoint(tags_frozen[i])]
+    else:
+        results = list(memories)
+
+    # Only pull in the archive when the requested page reaches the end of
+    # the hot set; >= so a page ending exactly at the boundary still sees
+    # the archive and reports the true total in the pagination footer
+    if params.offset + params.limit >= len(results):
+        archive = await asyncio.to_thread(load_archive)
         if filter_tags:
-            mem_tags = set(mem.get("tags", []))
-            if not any(t in mem_tags for t in filter_tags):
-                continue
-        results.append(mem)
-
-    # Sort by date (newest first)
-    results.sort(key=lambda m: m["created_at"], reverse=True)
+            results.extend(m for m in archive if not filter_tags.isdisjoint(m.get("tags", [])))
+        else:
+            results.extend(archive)
 
     total_matches = len(results)
 
+    # Newest first, but only the requested page needs ordering: top-k
+    # selection is O(N log k) versus O(N log N) for a full sort
+    wanted = params.offset + params.limit
+    if wanted < total_matches:
+        ordered = heapq.nlargest(wanted, results, key=itemgetter("created_at"))
+    else:
+        ordered = sorted(results, key=itemgetter("created_at"), reverse=True)
+
     # Apply pagination
-    paginated = results[params.offset:params.offset + params.limit]
+    paginated = ordered[params.offset:wanted]
 
     if not paginated:
         if params.offset > 0:
@@ -412,18 +722,29 @@ async def ea_forget(params: ForgetInput) -> str:
     if not params.confirm:
         return "Set confirm=True to delete. This action cannot be undone."
 
-    data = load_memories()
-
-    for i, mem in enumerate(data["memories"]):
-        if mem["id"] == params.memory_id:
-            removed = data["memories"].pop(i)
-            save_memories(data)
-            preview = removed['content'][:100]
-            if len(removed['content']) > 100:
-                preview += "..."
-            return f"Deleted: {params.memory_id}\nContent was: {preview}"
-
-    return f"Memory not found: {params.memory_id}. Use ea_list to see available memory IDs."
+    data = await asyncio.to_thread(load_memories)
+
+    # O(1) lookup through the primary index instead of scanning for the
+    # ID field. list.remove then only does identity comparisons.
+    removed = get_search_index(data)["by_id"].get(params.memory_id)
+    if removed is None:
+        # Not in the hot set; fall back to the archive
+        archive = await asyncio.to_thread(load_archive)
+        for mem in archive:
+            if mem["id"] == params.memory_id:
+                archive.remove(mem)
+                await asyncio.to_thread(save_archive, archive)
+                removed = mem
+                break
+        else:
+            return f"Memory not found: {params.memory_id}. Use ea_list to see available memory IDs."
+    else:
+        data["memories"].remove(removed)
+        await asyncio.to_thread(save_memories, data)
+    preview = removed['content'][:100]
+    if len(removed['content']) > 100:
+        preview += "..."
+    return f"Deleted: {params.memory_id}\nContent was: {preview}"
 
 
 @mcp.tool(
@@ -447,15 +768,18 @@ async def ea_memory_status() -> str:
     Returns:
         str: Server metadata and status formatted as markdown
     """
-    # Get storage stats
-    data = load_memories()
-    memory_count = len(data.get("memories", []))
+    # Get storage stats (hot set + archive)
+    data = await asyncio.to_thread(load_memories)
+    archive = await asyncio.to_thread(load_archive)
+    memory_count = len(data.get("memories", [])) + len(archive)
     storage_path = get_storage_path()
 
     # Get unique tags
     all_tags = set()
     for mem in data.get("memories", []):
         all_tags.update(mem.get("tags", []))
+    for mem in archive:
+        all_tags.update(mem.get("tags", []))
 
     tools_list = "\n".join(f"  - **{t['name']}**: {t['description']}" for t in SERVER_METADATA["tools"])
 
@@ -16,12 +16,19 @@ Prompts provided (via MCP Prompts capability):
 
 Tools provided:
 - ea_add_prompt: Add a custom prompt to your library
+- ea_add_prompts_bulk: Add multiple custom prompts in one call
 - ea_list_prompts: List all available prompts
 - ea_remove_prompt: Remove a custom prompt
 """
 
+import asyncio
+import atexit
+import io
 import json
+import os
 import re
+import sys
+from collections import ChainMap
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -39,6 +46,7 @@ SERVER_METADATA = {
     "capabilities": ["tools", "prompts"],
     "tools": [
         {"name": "ea_add_prompt", "description": "Add a custom prompt to your library"},
+        {"name": "ea_add_prompts_bulk", "description": "Add multiple custom prompts in one call"},
         {"name": "ea_list_prompts", "description": "List all available prompts"},
         {"name": "ea_remove_prompt", "description": "Remove a custom prompt"},
         {"name": "ea_prompts_status", "description": "Get server status and metadata"},
@@ -157,8 +165,69 @@ Analyze and suggest:
 }
 
 
+# Stored in name order so listings iterate directly instead of sorting
+# on every call (dicts preserve insertion order). Interned keys make the
+# per-call membership checks hit the pointer-equality fast path.
+BUILTIN_PROMPTS = {sys.intern(k): v for k, v in sorted(BUILTIN_PROMPTS.items())}
+
+# Templates split around their placeholders once at import, so serving
+# a prompt is plain string concatenation instead of str.format re-parsing
+# the template every call
+_CODE_REVIEW_PRE, _CODE_REVIEW_POST = BUILTIN_PROMPTS["code-review"]["template"].split("{code}")
+_EXPLAIN_CODE_PRE, _EXPLAIN_CODE_POST = BUILTIN_PROMPTS["explain-code"]["template"].split("{code}")
+_WRITE_TESTS_PRE, _WRITE_TESTS_POST = BUILTIN_PROMPTS["write-tests"]["template"].split("{code}")
+_REFACTOR_PRE, _REFACTOR_POST = BUILTIN_PROMPTS["refactor"]["template"].split("{code}")
+
+# The debug template has three placeholders; re.split yields alternating
+# literal text (even indices) and placeholder names (odd indices)
+_DEBUG_PARTS = re.split(r"\{(\w+)\}", BUILTIN_PROMPTS["debug"]["template"])
+
+
+# Static pieces of the ea_list_prompts output
+_LIST_HEADER = "# Available Prompts\n\n## Built-in Prompts\n\n"
+_CUSTOM_HEADER = "\n## Custom Prompts\n\n"
+
+
+def _render_prompt_md(name: str, prompt: dict, include_template: bool) -> str:
+    """Compose one prompt's markdown block as a single string."""
+    args = ", ".join(a["name"] for a in prompt.get("arguments", []))
+    block = ("### " + name
+             + "\n**Description:** " + prompt["description"]
+             + "\n**Arguments:** " + (args or "none"))
+    if include_template:
+        block += "\n\n```\n" + prompt["template"] + "\n```"
+    return block + "\n"
+
+
+def _render_builtin_section(include_templates: bool) -> str:
+    return "\n".join(
+        _render_prompt_md(name, prompt, include_templates)
+        for name, prompt in BUILTIN_PROMPTS.items()
+    )
+
+
+# BUILTIN_PROMPTS never changes, so its part of the ea_list_prompts
+# output is rendered once at import, in both variants. The per-prompt
+# argument-name joins are baked into these strings too.
+_BUILTIN_RENDERED_SHORT = _render_builtin_section(False)
+_BUILTIN_RENDERED_FULL = _render_builtin_section(True)
+
+# SERVER_METADATA is equally static, so the status listing joins are
+# frozen at import as well
+_TOOLS_LIST_MD = "\n".join(
+    f"  - **{t['name']}**: {t['description']}" for t in SERVER_METADATA["tools"]
+)
+_PROMPTS_LIST_MD = "\n".join(
+    f"  - **{p['name']}**: {p['description']}" for p in SERVER_METADATA["prompts"]
+)
+
+
 # === Pydantic Input Models ===
 
+# Character sets for the name validator's bytes-based fast path
+_NAME_ALLOWED = b"abcdefghijklmnopqrstuvwxyz0123456789-"
+
+
 class AddPromptInput(BaseModel):
     """Input for adding a custom prompt."""
     model_config = ConfigDict(str_strip_whitespace=True)
@@ -189,9 +258,26 @@ class AddPromptInput(BaseModel):
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not re.match(r'^[a-z][a-z0-9-]*$', v):
-            raise ValueError("Name must be lowercase letters, numbers, and hyphens only, starting with a letter")
-        return v
+        # C-level char sieve instead of the regex engine: translate with
+        # a deletion table returns empty iff every byte is allowed. The
+        # length check catches non-ASCII chars dropped by encode.
+        b = v.encode("ascii", "ignore")
+        if (len(b) == len(v)
+                and b"a" <= b[:1] <= b"z"
+                and not b.translate(None, _NAME_ALLOWED)):
+            return v
+        raise ValueError("Name must be lowercase letters, numbers, and hyphens only, starting with a letter")
+
+
+class BulkAddInput(BaseModel):
+    """Input for adding several custom prompts in one call."""
+
+    items: list[AddPromptInput] = Field(
+        ...,
+        description="Prompts to add, each with the same fields as ea_add_prompt",
+        min_length=1,
+        max_length=50
+    )
 
 
 class ListPromptsInput(BaseModel):
@@ -220,36 +306,182 @@ class RemovePromptInput(BaseModel):
 
 # === Storage ===
 
+# orjson (C extension) encodes/decodes several times faster than the
+# stdlib. It is optional: without it the shim falls back to json.
+try:
+    import orjson
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _loads(data):
+        return json.loads(data)
+
+
+# msgspec, when available, fuses JSON parsing with a shape check
+# (dict of dicts) in a single C pass. It still decodes to plain dicts
+# rather than msgspec.Struct classes, so every later code path is
+# identical whether or not the optional dependency is installed.
+try:
+    import msgspec
+
+    _PROMPTS_DECODER = msgspec.json.Decoder(dict[str, dict])
+except ImportError:
+    _PROMPTS_DECODER = None
+
+
+# Soft cap on library size so the store (kept fully in memory and
+# rewritten on every save) can't grow without bound
+MAX_CUSTOM_PROMPTS = 500
+
+
+# The storage directory is created once at import; doing it inside
+# get_storage_path cost a stat (and possibly a mkdir) on every tool call
+_STORAGE_DIR = Path.home() / ".ea-prompts"
+_STORAGE_DIR.mkdir(exist_ok=True)
+_STORAGE_PATH = _STORAGE_DIR / "custom_prompts.json"
+
+
 def get_storage_path() -> Path:
     """Get the path to the prompts storage file."""
-    storage_dir = Path.home() / ".ea-prompts"
-    storage_dir.mkdir(exist_ok=True)
-    return storage_dir / "custom_prompts.json"
+    return _STORAGE_PATH
+
+
+# In-process cache so the frequent list/add/remove paths don't re-read
+# and re-parse the file each call. Keyed on (mtime, size) so an edit
+# made outside this process still invalidates it.
+_PROMPT_CACHE: dict = {"key": None, "data": None}
 
 
 def load_custom_prompts() -> dict:
-    """Load custom prompts from storage."""
+    """Load custom prompts from storage (cached until the file changes).
+
+    Stored prompts were validated by AddPromptInput when they were
+    created, so this trusted path deliberately hydrates plain dicts and
+    skips any per-record validation pipeline on load.
+    """
+    # While a flush is pending the cache is newer than the file
+    if _DIRTY and _PROMPT_CACHE["data"] is not None:
+        return _PROMPT_CACHE["data"]
+
     storage_path = get_storage_path()
-    if storage_path.exists():
-        try:
-            return json.loads(storage_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    try:
+        st = storage_path.stat()
+    except FileNotFoundError:
+        return {}
 
+    key = (st.st_mtime_ns, st.st_size)
+    if _PROMPT_CACHE["key"] == key and _PROMPT_CACHE["data"] is not None:
+        return _PROMPT_CACHE["data"]
 
-def save_custom_prompts(prompts: dict) -> None:
-    """Save custom prompts to storage."""
+    try:
+        raw = storage_path.read_bytes()
+        if _PROMPTS_DECODER is not None:
+            # msgspec's decode errors subclass ValueError
+            prompts = _PROMPTS_DECODER.decode(raw)
+        else:
+            prompts = _loads(raw)
+    except (ValueError, IOError):
+        return {}
+
+    # Files written before sorted-on-save may be out of order; interning
+    # the names speeds up the repeated lookups against params.name
+    prompts = {sys.intern(k): v for k, v in sorted(prompts.items())}
+
+    _PROMPT_CACHE["key"] = key
+    _PROMPT_CACHE["data"] = prompts
+    return prompts
+
+
+FLUSH_DELAY = 0.25  # seconds of coalescing before a burst hits disk
+
+_FLUSH_TASK: Optional[asyncio.Task] = None
+_DIRTY = False    # cache holds newer data than the file
+_SAVE_GEN = 0     # bumped by every save, so the flusher can tell when a
+                  # save landed while it was busy writing
+
+
+def _write_prompts_file() -> None:
+    """Write the cached prompts atomically (temp file + rename)."""
+    prompts = _PROMPT_CACHE["data"] if _PROMPT_CACHE["data"] is not None else {}
     storage_path = get_storage_path()
-    storage_path.write_text(json.dumps(prompts, indent=2), encoding="utf-8")
+    tmp_path = storage_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(_dumps(prompts, pretty=True))
+    os.replace(tmp_path, storage_path)
+    st = storage_path.stat()
+    _PROMPT_CACHE["key"] = (st.st_mtime_ns, st.st_size)
+
+
+async def _delayed_flush() -> None:
+    global _DIRTY
+    await asyncio.sleep(FLUSH_DELAY)
+    # A save can land while the worker is mid-write; its generation bump
+    # keeps the store dirty and the loop writes again. The flag is only
+    # cleared here on the event loop - the same thread saves run on - so
+    # a newer save can never be clobbered by a stale writer.
+    while _DIRTY:
+        gen = _SAVE_GEN
+        await asyncio.to_thread(_write_prompts_file)
+        if _SAVE_GEN == gen:
+            _DIRTY = False
+
+
+def save_custom_prompts(prompts: dict) -> None:
+    """Persist custom prompts.
+
+    The in-process cache is updated immediately; the disk write is
+    debounced by FLUSH_DELAY so a burst of adds coalesces into one
+    write, and done via temp file + rename so a crash mid-write can't
+    leave a half-written store.
+    """
+    global _FLUSH_TASK, _DIRTY, _SAVE_GEN
+    # Keep name order on every save so listings never need to sort
+    _PROMPT_CACHE["data"] = dict(sorted(prompts.items()))
+    _SAVE_GEN += 1
+    _DIRTY = True
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (e.g. called from a script): write through
+        _write_prompts_file()
+        _DIRTY = False
+        return
+    if _FLUSH_TASK is None or _FLUSH_TASK.done():
+        _FLUSH_TASK = loop.create_task(_delayed_flush())
 
 
-def get_all_prompts() -> dict:
-    """Get all prompts (builtin + custom)."""
-    all_prompts = dict(BUILTIN_PROMPTS)
-    custom = load_custom_prompts()
-    all_prompts.update(custom)
-    return all_prompts
+def _flush_on_exit() -> None:
+    global _DIRTY
+    if _DIRTY:
+        _write_prompts_file()
+        _DIRTY = False
+
+
+# Don't lose a pending flush on shutdown
+atexit.register(_flush_on_exit)
+
+
+# Serializes read-modify-write cycles so two concurrent ea_add_prompt
+# calls can't load the same snapshot and drop each other's prompt
+_STORE_LOCK = asyncio.Lock()
+
+
+def get_all_prompts() -> ChainMap:
+    """Get all prompts (builtin + custom) as a merged view.
+
+    ChainMap avoids copying BUILTIN_PROMPTS on every call; custom
+    prompts shadow builtins of the same name (which ea_add_prompt
+    forbids anyway).
+    """
+    return ChainMap(load_custom_prompts(), BUILTIN_PROMPTS)
 
 
 # === Register MCP Prompts ===
@@ -257,35 +489,62 @@ def get_all_prompts() -> dict:
 @mcp.prompt()
 def code_review(code: str) -> str:
     """Review code for issues and improvements."""
-    return BUILTIN_PROMPTS["code-review"]["template"].format(code=code)
+    return _CODE_REVIEW_PRE + code + _CODE_REVIEW_POST
 
 
 @mcp.prompt()
 def explain_code(code: str) -> str:
     """Explain what code does in plain English."""
-    return BUILTIN_PROMPTS["explain-code"]["template"].format(code=code)
+    return _EXPLAIN_CODE_PRE + code + _EXPLAIN_CODE_POST
 
 
 @mcp.prompt()
 def write_tests(code: str) -> str:
     """Generate test cases for code."""
-    return BUILTIN_PROMPTS["write-tests"]["template"].format(code=code)
+    return _WRITE_TESTS_PRE + code + _WRITE_TESTS_POST
 
 
 @mcp.prompt()
 def refactor(code: str) -> str:
     """Suggest refactoring improvements."""
-    return BUILTIN_PROMPTS["refactor"]["template"].format(code=code)
+    return _REFACTOR_PRE + code + _REFACTOR_POST
 
 
 @mcp.prompt()
 def debug(error: str, code: str, steps: str = "Not provided") -> str:
     """Help debug an error or issue."""
-    return BUILTIN_PROMPTS["debug"]["template"].format(error=error, code=code, steps=steps)
+    values = {"error": error, "code": code, "steps": steps}
+    return "".join(
+        values[part] if i & 1 else part
+        for i, part in enumerate(_DEBUG_PARTS)
+    )
 
 
 # === Tools ===
 
+def _build_prompt(params: AddPromptInput) -> dict:
+    """Build the stored prompt record from validated input."""
+    arg_list = []
+    if params.arguments:
+        for arg in params.arguments.split(","):
+            arg = arg.strip()
+            if arg:
+                arg_list.append({
+                    "name": arg,
+                    "description": f"Value for {arg}",
+                    "required": True
+                })
+
+    return {
+        "name": params.name,
+        "description": params.description,
+        "template": params.template,
+        "arguments": arg_list,
+        "builtin": False,
+        "created_at": datetime.now(timezone.utc).isoformat()
+    }
+
+
 @mcp.tool(
     name="ea_add_prompt",
     annotations={
@@ -319,30 +578,21 @@ async def ea_add_prompt(params: AddPromptInput) -> str:
     if params.name in BUILTIN_PROMPTS:
         return f"Error: '{params.name}' is a built-in prompt and cannot be overwritten."
 
-    # Parse arguments
-    arg_list = []
-    if params.arguments:
-        for arg in params.arguments.split(","):
-            arg = arg.strip()
-            if arg:
-                arg_list.append({
-                    "name": arg,
-                    "description": f"Value for {arg}",
-                    "required": True
-                })
-
-    prompt = {
-        "name": params.name,
-        "description": params.description,
-        "template": params.template,
-        "arguments": arg_list,
-        "builtin": False,
-        "created_at": datetime.now(timezone.utc).isoformat()
-    }
-
-    custom = load_custom_prompts()
-    custom[params.name] = prompt
-    save_custom_prompts(custom)
+    prompt = _build_prompt(params)
+    arg_list = prompt["arguments"]
+
+    async with _STORE_LOCK:
+        # Copy before mutating: load returns the live cached dict, which
+        # the flush worker may be serializing in a thread right now
+        custom = dict(await asyncio.to_thread(load_custom_prompts))
+        if params.name not in custom and len(custom) >= MAX_CUSTOM_PROMPTS:
+            return (f"Error: prompt library is full ({MAX_CUSTOM_PROMPTS} custom prompts). "
+                    "Remove unused prompts with ea_remove_prompt first.")
+        custom[params.name] = prompt
+        # Called on the loop so save_custom_prompts can see the running
+        # loop and schedule the debounced flush; the disk write itself
+        # happens in _delayed_flush via to_thread
+        save_custom_prompts(custom)
 
     args_display = ', '.join(a['name'] for a in arg_list) if arg_list else 'none'
     return f"""Custom prompt added: {params.name}
@@ -352,6 +602,61 @@ Arguments: {args_display}
 Use with: /prompt {params.name}"""
 
 
+@mcp.tool(
+    name="ea_add_prompts_bulk",
+    annotations={
+        "title": "Add Multiple Custom Prompts",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False
+    }
+)
+async def ea_add_prompts_bulk(params: BulkAddInput) -> str:
+    """Add several custom prompts in one call.
+
+    MCP clients issue tool calls one at a time, so adding a library of
+    prompts via ea_add_prompt pays a full round-trip per prompt. This
+    tool validates and persists the whole batch with a single load and
+    a single save.
+
+    Args:
+        params: BulkAddInput containing:
+            - items (list[AddPromptInput]): Prompts to add (1-50)
+
+    Returns:
+        str: Summary of added and rejected prompts
+
+    Examples:
+        - Add a set of project prompts imported from a teammate
+    """
+    added = []
+    errors = []
+
+    async with _STORE_LOCK:
+        # Copy before mutating (see ea_add_prompt)
+        custom = dict(await asyncio.to_thread(load_custom_prompts))
+        for item in params.items:
+            if item.name in BUILTIN_PROMPTS:
+                errors.append(f"{item.name}: built-in prompt, cannot be overwritten")
+                continue
+            if item.name not in custom and len(custom) >= MAX_CUSTOM_PROMPTS:
+                errors.append(f"{item.name}: prompt library is full ({MAX_CUSTOM_PROMPTS} custom prompts)")
+                continue
+            custom[item.name] = _build_prompt(item)
+            added.append(item.name)
+        if added:
+            save_custom_prompts(custom)
+
+    lines = [f"Added {len(added)} of {len(params.items)} prompts."]
+    if added:
+        lines.append("Added: " + ", ".join(added))
+    if errors:
+        lines.append("Skipped:")
+        lines.extend(f"  - {e}" for e in errors)
+    return "\n".join(lines)
+
+
 @mcp.tool(
     name="ea_list_prompts",
     annotations={
@@ -378,40 +683,32 @@ async def ea_list_prompts(params: ListPromptsInput) -> str:
         - "List prompts" -> shows names and descriptions
         - "List prompts with templates" -> shows full template text
     """
-    all_prompts = get_all_prompts()
+    # One storage read serves both sections; the built-ins are a module
+    # constant and don't need get_all_prompts' merged dict. The read
+    # happens off the event loop in case it hits a cold cache.
+    custom = await asyncio.to_thread(load_custom_prompts)
 
-    if not all_prompts:
+    if not BUILTIN_PROMPTS and not custom:
         return "No prompts available."
 
-    output = ["# Available Prompts\n"]
-    output.append("## Built-in Prompts\n")
-
-    for name, prompt in sorted(all_prompts.items()):
-        if prompt.get("builtin"):
-            args = ", ".join(a["name"] for a in prompt.get("arguments", []))
-            output.append(f"### {name}")
-            output.append(f"**Description:** {prompt['description']}")
-            output.append(f"**Arguments:** {args or 'none'}")
-            if params.include_templates:
-                output.append(f"\n```\n{prompt['template']}\n```")
-            output.append("")
+    # Write whole blocks into one buffer instead of accumulating many
+    # small f-string fragments in a list
+    buf = io.StringIO()
+    buf.write(_LIST_HEADER)
+    buf.write(_BUILTIN_RENDERED_FULL if params.include_templates else _BUILTIN_RENDERED_SHORT)
 
     # Custom prompts
-    custom = load_custom_prompts()
     if custom:
-        output.append("## Custom Prompts\n")
-        for name, prompt in sorted(custom.items()):
-            args = ", ".join(a["name"] for a in prompt.get("arguments", []))
-            output.append(f"### {name}")
-            output.append(f"**Description:** {prompt['description']}")
-            output.append(f"**Arguments:** {args or 'none'}")
-            if params.include_templates:
-                output.append(f"\n```\n{prompt['template']}\n```")
-            output.append("")
+        buf.write(_CUSTOM_HEADER)
+        for name, prompt in custom.items():
+            buf.write(_render_prompt_md(name, prompt, params.include_templates))
+            buf.write("\n")
+    else:
+        buf.write("\n")
 
-    output.append(f"**Total:** {len(BUILTIN_PROMPTS)} built-in, {len(custom)} custom")
+    buf.write(f"**Total:** {len(BUILTIN_PROMPTS)} built-in, {len(custom)} custom")
 
-    return "\n".join(output)
+    return buf.getvalue()
 
 
 @mcp.tool(
@@ -447,12 +744,14 @@ async def ea_remove_prompt(params: RemovePromptInput) -> str:
     if params.name in BUILTIN_PROMPTS:
         return f"Error: '{params.name}' is a built-in prompt and cannot be removed."
 
-    custom = load_custom_prompts()
-    if params.name not in custom:
-        return f"Custom prompt not found: {params.name}. Use ea_list_prompts to see available prompts."
+    async with _STORE_LOCK:
+        # Copy before mutating (see ea_add_prompt)
+        custom = dict(await asyncio.to_thread(load_custom_prompts))
+        if params.name not in custom:
+            return f"Custom prompt not found: {params.name}. Use ea_list_prompts to see available prompts."
 
-    del custom[params.name]
-    save_custom_prompts(custom)
+        del custom[params.name]
+        save_custom_prompts(custom)
 
     return f"Removed custom prompt: {params.name}"
 
@@ -478,11 +777,11 @@ async def ea_prompts_status() -> str:
     Returns:
         str: Server metadata and status formatted as markdown
     """
-    custom = load_custom_prompts()
+    custom = await asyncio.to_thread(load_custom_prompts)
     storage_path = get_storage_path()
 
-    tools_list = "\n".join(f"  - **{t['name']}**: {t['description']}" for t in SERVER_METADATA["tools"])
-    prompts_list = "\n".join(f"  - **{p['name']}**: {p['description']}" for p in SERVER_METADATA["prompts"])
+    tools_list = _TOOLS_LIST_MD
+    prompts_list = _PROMPTS_LIST_MD
 
     return f"""# {SERVER_METADATA['name']} v{SERVER_METADATA['version']}
 
@@ -514,4 +813,7 @@ Server is running and ready to accept commands."""
 # === Entry Point ===
 
 if __name__ == "__main__":
+    # Warm the prompt cache (mkdir + stat + read + parse) before serving
+    # so the first tool call is as fast as steady state
+    load_custom_prompts()
     mcp.run()